@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import sys
@@ -18,7 +19,8 @@ if os.name != "nt":
     try:
         import uvloop  # type: ignore
 
-        uvloop.install()
+        # uvloop.install is deprecated, set the policy so the loop hikari creates is a uvloop one
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
         logging.info("Running with uvloop event loop")
 
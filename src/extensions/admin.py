@@ -14,6 +14,7 @@ from src.models import (
     BBombsBotPrefixContext,
 )
 from src.static import *
+from src.static.re import SQL_CODEBLOCK_REGEX
 
 admin = BBombsBotPlugin("admin")
 admin.add_checks(lightbulb.owner_only)
@@ -128,7 +129,7 @@ async def eval_sql(ctx: BBombsBotPrefixContext, code: str) -> None:
     if ctx.attachments and ctx.attachments[0].filename.endswith(".sql"):
         sql = (await ctx.attachments[0].read()).decode()
     elif code:
-        sql = code.replace("```sql", "").replace("`", "").strip()
+        sql = SQL_CODEBLOCK_REGEX.sub("", code).strip()
     else:
         await ctx.respond_with_failure("**Could not find attached file or sql in message**", edit=True)
         return
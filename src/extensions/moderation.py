@@ -1,16 +1,32 @@
 import hikari
 
 from src.models import BBombsBot, BBombsBotPlugin
+from src.utils import clear_bot_top_role
 
 moderation = BBombsBotPlugin("moderation")
 
 
 @moderation.listener(hikari.GuildMessageCreateEvent)
+async def run_automod_create(event: hikari.GuildMessageCreateEvent) -> None:
+    await moderation.app.auto_mod.check_create(event)
+
+
 @moderation.listener(hikari.GuildMessageUpdateEvent)
-async def run_automod(
-    event: hikari.GuildMessageUpdateEvent | hikari.GuildMessageCreateEvent,
-):
-    await moderation.app.auto_mod.check(event)
+async def run_automod_update(event: hikari.GuildMessageUpdateEvent) -> None:
+    await moderation.app.auto_mod.check_update(event)
+
+
+@moderation.listener(hikari.RoleEvent)
+async def clear_top_role_on_role_change(event: hikari.RoleEvent) -> None:
+    clear_bot_top_role(event.guild_id)
+
+
+@moderation.listener(hikari.MemberUpdateEvent)
+async def clear_top_role_on_bot_update(event: hikari.MemberUpdateEvent) -> None:
+    me = moderation.app.get_me()
+
+    if me and event.user_id == me.id:
+        clear_bot_top_role(event.guild_id)
 
 
 def load(bot: BBombsBot) -> None:
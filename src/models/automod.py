@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import enum
 import os
 import typing as t
 from contextlib import suppress
 
+import attr
 import hikari
 from Levenshtein import distance
 
@@ -16,7 +18,7 @@ from src.models.database_member import DatabaseMember
 from src.models.ratelimiter import MessageRateLimiter
 from src.models.safebrowsing import SafebrowsingClient
 from src.static.re import *
-from src.utils import can_mod, domain_in_list
+from src.utils import can_mod, extract_domain, get_domain_list
 
 MESSAGE_SPAM_RATELIMITER = MessageRateLimiter(5, 5)
 DUPLICATE_SPAM_RATELIMITER = MessageRateLimiter(10, 4, 4)
@@ -31,7 +33,7 @@ BLOCK_FAKE_URL = True
 MENTION_FILTER_LIMIT = 9
 
 
-class AutoModMediaType(enum.Enum):
+class AutoModMediaType(enum.StrEnum):
     """Types of media the automod handles as enums."""
 
     MENTION = "mentions"
@@ -44,19 +46,63 @@ class AutoModMediaType(enum.Enum):
     UNDEFINED = "undefined"
 
 
-class AutoModOffenceType(enum.Enum):
+class AutoModOffenceType(enum.StrEnum):
     """Types of offences the automod handles as enums."""
 
     SPAM = "spam"
     BLOCKED = "blocked"
 
 
+@attr.define
+class MessageScan:
+    """Content of a message and the results of scanning it, shared between automod checks."""
+
+    content: str
+    """The content of the message, empty if it has none."""
+
+    content_lower: str
+    """The lowercase content of the message."""
+
+    urls: list[tuple[str, str, str]]
+    """Url matches in the message content."""
+
+    has_invite: bool
+    """Whether the message content contains a discord invite."""
+
+    has_fake_link: bool
+    """Whether the message content contains a hyperlink which uses an url as its text."""
+
+    @classmethod
+    def from_message(cls, message: hikari.PartialMessage) -> MessageScan:
+        """Scan the content of a message once for every automod check.
+
+        Parameters
+        ----------
+        message : hikari.PartialMessage
+            The message to scan.
+
+        """
+        content = message.content or ""
+        content_lower = content.lower()
+
+        # Substring tests are far cheaper than the regex and rule out most messages
+        return cls(
+            content=content,
+            content_lower=content_lower,
+            urls=URL_FINDALL(content) if "http" in content_lower else [],
+            has_invite="discord" in content_lower and INVITE_SEARCH(content_lower) is not None,
+            has_fake_link="](http" in content and FAKE_URL_SEARCH(content) is not None,
+        )
+
+
 class AutoMod:
     """AutoMod class for automatically moderating members."""
 
     def __init__(self, app: BBombsBot) -> None:
         self._app: BBombsBot = app
         self._lists_dir: str = os.path.join(app.base_dir, "src", "static", "lists")
+        self._whitelist_path: str = os.path.join(self._lists_dir, "domain_whitelist.txt")
+        self._blacklist_path: str = os.path.join(self._lists_dir, "domain_blacklist.txt")
         self._safebrowsing_client = SafebrowsingClient(app.config.SAFEBROWSING_TOKEN, "bbombsbot", "0.1.1")
 
     @property
@@ -122,12 +168,12 @@ class AutoMod:
         """
         offender = self.app.cache.get_member(message.guild_id, message.author.id)
         guild = offender.get_guild()
-        db_member = await DatabaseMember.fetch(offender.id, offender.guild_id)
 
-        with suppress(hikari.NotFoundError):
-            await message.delete()
-            if message_queue:
-                await self.app.rest.delete_messages(message.channel_id, message_queue)
+        # Delete the offending messages while the offender's strikes are being fetched
+        db_member, _ = await asyncio.gather(
+            DatabaseMember.fetch(offender.id, offender.guild_id),
+            self._delete_messages(message, message_queue),
+        )
 
         if db_member.strikes < 4 and offence == AutoModOffenceType.BLOCKED:
             db_member.strikes += 1
@@ -151,7 +197,15 @@ Continued violation may result in further action.""",
 
             return
 
-    async def find_message_spam(self, message: hikari.PartialMessage) -> bool:
+    async def _delete_messages(
+        self, message: hikari.PartialMessage, message_queue: list[hikari.Snowflake] | None = None
+    ) -> None:
+        with suppress(hikari.NotFoundError):
+            await message.delete()
+            if message_queue:
+                await self.app.rest.delete_messages(message.channel_id, message_queue)
+
+    async def find_message_spam(self, message: hikari.PartialMessage, scan: MessageScan) -> bool:
         """Check for common types of spam.
 
         Returns False if the message is offending otherwise True
@@ -165,12 +219,12 @@ Continued violation may result in further action.""",
 
         return True
 
-    async def find_duplicate_spam(self, message: hikari.PartialMessage) -> bool:
+    async def find_duplicate_spam(self, message: hikari.PartialMessage, scan: MessageScan) -> bool:
         """Check for duplicate message spamming.
 
         Returns False if the message is offending otherwise True
         """
-        if not message.content:
+        if not scan.content:
             return True
 
         queue = DUPLICATE_SPAM_RATELIMITER.get_messages(message)
@@ -181,7 +235,18 @@ Continued violation may result in further action.""",
 
         prev_msg = self.app.cache.get_message(queue[-1])
 
-        if prev_msg and distance(prev_msg.content.strip(), message.content.strip()) < 5:  # type: ignore
+        if not prev_msg or not prev_msg.content:
+            return True
+
+        prev_content = prev_msg.content.strip()
+        content = scan.content.strip()
+
+        # Messages whose lengths differ by 5 or more are at least 5 edits apart
+        if abs(len(prev_content) - len(content)) >= 5:
+            return True
+
+        # The cutoff lets the distance calculation stop early once messages are clearly different
+        if distance(prev_content, content, score_cutoff=4) < 5:
             DUPLICATE_SPAM_RATELIMITER.add_message(message)
 
             if DUPLICATE_SPAM_RATELIMITER.is_rate_limited(message):
@@ -194,12 +259,12 @@ Continued violation may result in further action.""",
 
         return True
 
-    async def find_invite_spam(self, message: hikari.PartialMessage) -> bool:
+    async def find_invite_spam(self, message: hikari.PartialMessage, scan: MessageScan) -> bool:
         """Check for messages with invites being spammed.
 
         Returns False if the message is offending otherwise True
         """
-        if message.content and INVITE_REGEX.findall(message.content.lower()):
+        if scan.has_invite:
             INVITE_SPAM_RATELIMITER.add_message(message)
 
         if INVITE_SPAM_RATELIMITER.is_rate_limited(message):
@@ -210,12 +275,12 @@ Continued violation may result in further action.""",
 
         return True
 
-    async def find_link_spam(self, message: hikari.PartialMessage) -> bool:
+    async def find_link_spam(self, message: hikari.PartialMessage, scan: MessageScan) -> bool:
         """Check for messages with links being spammed.
 
         Returns False if the message is offending otherwise True
         """
-        if message.content and URL_REGEX.findall(message.content.lower()):
+        if scan.urls:
             LINK_SPAM_RATELIMITER.add_message(message)
 
         if LINK_SPAM_RATELIMITER.is_rate_limited(message):
@@ -226,7 +291,7 @@ Continued violation may result in further action.""",
 
         return True
 
-    async def find_attach_spam(self, message: hikari.PartialMessage) -> bool:
+    async def find_attach_spam(self, message: hikari.PartialMessage, scan: MessageScan) -> bool:
         """Check for messages with attachments being spammed.
 
         Returns False if the message is offending otherwise True
@@ -244,18 +309,18 @@ Continued violation may result in further action.""",
 
         return True
 
-    async def find_mention_spam(self, message: hikari.PartialMessage) -> bool:
+    async def find_mention_spam(self, message: hikari.PartialMessage, scan: MessageScan) -> bool:
         """Check for messages with mentions being spammed.
 
         Returns False if the message is offending otherwise True
         """
         assert message.author
+        author_id = message.author.id
 
-        if message.user_mentions:
-            for mention in message.user_mentions.values():
-                if mention.is_bot or mention.id == message.author.id:
-                    return True
-
+        # Mentions of bots or of the author themselves do not count towards spam
+        if message.user_mentions and any(
+            mention.id != author_id and not mention.is_bot for mention in message.user_mentions.values()
+        ):
             MENTION_SPAM_RATELIMITER.add_message(message)
 
         if MENTION_SPAM_RATELIMITER.is_rate_limited(message):
@@ -266,49 +331,42 @@ Continued violation may result in further action.""",
 
         return True
 
-    async def block_invites(self, message: hikari.PartialMessage) -> bool:
+    async def block_invites(self, message: hikari.PartialMessage, scan: MessageScan) -> bool:
         """Check for messages with invite links.
 
         Returns False if the message is offending otherwise True
         """
-        if BLOCK_INVITES and message.content and INVITE_REGEX.findall(message.content):
+        if BLOCK_INVITES and scan.has_invite:
             reason = "invite links are not allowed."
             await self.moderate(message, AutoModOffenceType.BLOCKED, AutoModMediaType.INVITE, reason)
             return False
 
         return True
 
-    async def block_malicious_links(self, message: hikari.PartialMessage) -> bool:
+    async def block_malicious_links(self, message: hikari.PartialMessage, scan: MessageScan) -> bool:
         """Check to see if a message contains malicious links.
 
         Returns False if the message is offending otherwise True
         """
-        if not message.content or not URL_REGEX.findall(message.content.lower()):
+        if not scan.urls:
             return True
 
         reason = "this web resource is not allowed."
 
-        matches = URL_REGEX.findall(message.content.lower())
-        refined_matches = []
-
-        whitelist = os.path.join(self.lists_dir, "domain_whitelist.txt")
-        blacklist = os.path.join(self.lists_dir, "domain_blacklist.txt")
+        domains = {url: extract_domain(url) for url in ("".join(match) for match in scan.urls)}
+        whitelisted = await get_domain_list(self._whitelist_path)
+        urls = [url for url, domain in domains.items() if domain not in whitelisted]
 
-        for match in matches:
-            if not await domain_in_list("".join(match), whitelist):
-                refined_matches.append(match)
-
-        if not refined_matches:
+        if not urls:
             return True
 
         # Resolve url ...
 
-        for match in refined_matches:
-            if await domain_in_list("".join(match), blacklist):
-                await self.moderate(message, AutoModOffenceType.BLOCKED, AutoModMediaType.LINK, reason)
-                return False
+        blacklisted = await get_domain_list(self._blacklist_path)
 
-        urls = ["".join(match) for match in refined_matches]
+        if any(domains[url] in blacklisted for url in urls):
+            await self.moderate(message, AutoModOffenceType.BLOCKED, AutoModMediaType.LINK, reason)
+            return False
 
         results = await self.safebrowsing_client.check(urls)
 
@@ -318,28 +376,38 @@ Continued violation may result in further action.""",
 
         return True
 
-    async def block_fake_links(self, message: hikari.PartialMessage) -> bool:
+    async def block_fake_links(self, message: hikari.PartialMessage, scan: MessageScan) -> bool:
         """Check for messages with hyperlinks where the hyperlink text is also an url.
 
         Returns False if the message is offending otherwise True
         """
-        if BLOCK_FAKE_URL and message.content and FAKE_URL_REGEX.findall(message.content):
+        if BLOCK_FAKE_URL and scan.has_fake_link:
             reason = "hyperlink contains link as text string."
             await self.moderate(message, AutoModOffenceType.BLOCKED, AutoModMediaType.HYPERLINK, reason)
             return False
 
         return True
 
-    async def limit_mentions(self, message: hikari.PartialMessage) -> bool:
+    async def limit_mentions(self, message: hikari.PartialMessage, scan: MessageScan) -> bool:
         """Check for messages with lots of mentions of different users.
 
         Returns False if the message is offending otherwise True
         """
         assert message.author
 
-        if mentions := message.user_mentions:
-            count = sum(mention.id != message.author.id and not mention.is_bot for mention in mentions.values())
+        if not message.user_mentions:
+            return True
+
+        author_id = message.author.id
+        count = 0
+
+        for mention in message.user_mentions.values():
+            if mention.id == author_id or mention.is_bot:
+                continue
+
+            count += 1
 
+            # No need to count the rest once over the limit
             if count > MENTION_FILTER_LIMIT:
                 reason = "message contains too many consecutive mentions."
                 await self.moderate(message, AutoModOffenceType.BLOCKED, AutoModMediaType.MENTION, reason)
@@ -347,17 +415,21 @@ Continued violation may result in further action.""",
 
         return True
 
-    async def check(self, event: hikari.GuildMessageUpdateEvent | hikari.GuildMessageCreateEvent) -> None:
-        """Run automod checks on created or updated messages.
+    async def run_checks(
+        self,
+        message: hikari.PartialMessage,
+        checks: tuple[t.Callable[[hikari.PartialMessage, MessageScan], t.Awaitable[bool]], ...],
+    ) -> None:
+        """Run automod checks on a message in order, stopping at the first offence.
 
         Parameters
         ----------
-        event : hikari.GuildMessageUpdateEvent | hikari.GuildMessageCreateEvent
-            The message event to check for offences.
+        message : hikari.PartialMessage
+            The message to check for offences.
+        checks : tuple[Callable[[hikari.PartialMessage, MessageScan], Awaitable[bool]], ...]
+            The checks to run, each returns False if the message is offending otherwise True.
 
         """
-        message = event.message
-
         if not message.author:
             return
         if message.guild_id is None:
@@ -374,30 +446,57 @@ Continued violation may result in further action.""",
         # if not self.can_automod(member, bot):
         #     return
 
-        if isinstance(event, hikari.GuildMessageCreateEvent):
-            all(
-                (
-                    await self.find_message_spam(message),
-                    await self.find_duplicate_spam(message),
-                    await self.find_invite_spam(message),
-                    await self.find_link_spam(message),
-                    await self.find_attach_spam(message),
-                    await self.find_mention_spam(message),
-                    await self.block_malicious_links(message),
-                    await self.block_invites(message),
-                    await self.block_fake_links(message),
-                    await self.limit_mentions(message),
-                )
-            )
-        elif isinstance(event, hikari.GuildMessageUpdateEvent):
-            all(
-                (
-                    await self.block_malicious_links(message),
-                    await self.block_invites(message),
-                    await self.block_fake_links(message),
-                    await self.limit_mentions(message),
-                )
-            )
+        scan = MessageScan.from_message(message)
+
+        # Stop at the first offence, the message has already been moderated
+        for check in checks:
+            if not await check(message, scan):
+                return
+
+    async def check_create(self, event: hikari.GuildMessageCreateEvent) -> None:
+        """Run automod checks on created messages.
+
+        Parameters
+        ----------
+        event : hikari.GuildMessageCreateEvent
+            The message event to check for offences.
+
+        """
+        # Local checks run before block_malicious_links so offending messages skip its network lookup
+        await self.run_checks(
+            event.message,
+            (
+                self.find_message_spam,
+                self.find_duplicate_spam,
+                self.find_invite_spam,
+                self.find_link_spam,
+                self.find_attach_spam,
+                self.find_mention_spam,
+                self.block_invites,
+                self.block_fake_links,
+                self.limit_mentions,
+                self.block_malicious_links,
+            ),
+        )
+
+    async def check_update(self, event: hikari.GuildMessageUpdateEvent) -> None:
+        """Run automod checks on updated messages, edits are not counted towards spam.
+
+        Parameters
+        ----------
+        event : hikari.GuildMessageUpdateEvent
+            The message event to check for offences.
+
+        """
+        await self.run_checks(
+            event.message,
+            (
+                self.block_invites,
+                self.block_fake_links,
+                self.limit_mentions,
+                self.block_malicious_links,
+            ),
+        )
 
 
 # Copyright (C) 2025 BBombs
@@ -1,11 +1,12 @@
+import asyncio
 import datetime
 import logging
 import os
+import sys
 import tomllib
 import typing as t
 from pathlib import Path
 
-import aiofiles
 import hikari
 import lightbulb
 import miru
@@ -78,7 +79,7 @@ class BBombsBot(lightbulb.BotApp):
         self._base_dir = str(Path(os.path.abspath(__file__)).parents[2])
         self._debug_mode = config.DEBUG_MODE
         self._startup_guilds: list = []
-        self._version: str
+        self._version: str = self._read_version()
 
         self._db = Database(self)
         self._miru_client = miru.Client(self)
@@ -93,9 +94,6 @@ class BBombsBot(lightbulb.BotApp):
     @property
     def version(self) -> str:
         """Returns the running version of BBombsBot."""
-        if self._version is None:
-            raise ApplicationStateError("App version is unavailable until bot has started.")
-
         return self._version
 
     @property
@@ -174,9 +172,18 @@ class BBombsBot(lightbulb.BotApp):
     ) -> BBombsBotPrefixContext:
         return await super().get_prefix_context(event, cls)  # type: ignore
 
+    def _read_version(self) -> str:
+        """Read the version from pyproject.toml, it only changes between deployments so is read once."""
+        with open(os.path.join(self._base_dir, "pyproject.toml"), "rb") as file:
+            return tomllib.load(file).get("project", {}).get("version", "2.0.0")
+
     async def on_starting(self, event: hikari.StartingEvent) -> None:
         logger.info("Initialising BBombsBot...")
 
+        # Tasks that finish without suspending, such as fully cached safebrowsing checks, skip scheduling on the loop
+        if sys.version_info >= (3, 12):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
         await self.db.connect()
         await self.db.migrate_schema()
 
@@ -187,16 +194,14 @@ class BBombsBot(lightbulb.BotApp):
         if user:
             self._user_id = user.id
 
-        toml_path = os.path.join(self.base_dir, "pyproject.toml")
-        version: str = "2.0.0"
-
-        async with aiofiles.open(toml_path, "rb") as file:
-            toml_data = await file.read()
-            toml = tomllib.loads(toml_data.decode("utf-8"))
-            self._version = toml.get("project", {}).get("version", version)
-
         self._auto_mod = AutoMod(self)
 
+        # Owners are otherwise only fetched lazily by the owner_only check, stored as a set for fast lookups
+        try:
+            self.owner_ids = frozenset(await self.fetch_owner_ids())  # type: ignore
+        except Exception:
+            logger.exception("Failed to fetch owner ids, they will be fetched when first needed")
+
         if self._debug_mode:
             logger.warning("Debug mode is active")
 
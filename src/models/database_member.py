@@ -9,6 +9,19 @@ if t.TYPE_CHECKING:
     from src.models.bot import BBombsBot
 
 from src.models.database import Database, DatabaseModel
+from src.utils import TTLCache
+
+__all__ = ["DatabaseMember"]
+
+# Kept as constants so every call sends identical query text and hits
+# asyncpg's per-connection prepared statement cache.
+UPSERT_MEMBER_QUERY = """
+INSERT INTO members (userId, guildId, strikes)
+VALUES ($1, $2, $3)
+ON CONFLICT (userId, guildId) DO
+UPDATE SET strikes = $3
+"""
+FETCH_MEMBER_QUERY = "SELECT userId, guildId, strikes FROM members WHERE userId = $1 and guildId = $2"
 
 
 @attr.define
@@ -24,19 +37,13 @@ class DatabaseMember(DatabaseModel):
     strikes: int = 0
     """The number of strikes against this member."""
 
+    _cache: t.ClassVar[TTLCache[tuple[int, int], DatabaseMember]] = TTLCache(10_000, 300)
+    """Recently fetched members, so repeated offences do not each cost a database round trip."""
+
     async def update(self) -> None:
         """Update this member or add them if not already stored."""
-        await self._db.execute(
-            """
-            INSERT INTO members (userId, guildId, strikes)
-            VALUES ($1, $2, $3)
-            ON CONFLICT (userId, guildId) DO
-            UPDATE SET strikes = $3
-            """,
-            self.id,
-            self.guild_id,
-            self.strikes,
-        )
+        await self._db.execute(UPSERT_MEMBER_QUERY, self.id, self.guild_id, self.strikes)
+        self._cache.set((self.id, self.guild_id), self)
 
     @classmethod
     async def fetch(
@@ -57,16 +64,21 @@ class DatabaseMember(DatabaseModel):
             Dataclass for stored members in the database.
 
         """
-        record = await cls._db.fetchrow(
-            "SELECT * FROM members WHERE userId = $1 and guildId = $2", hikari.Snowflake(user), hikari.Snowflake(guild)
-        )
+        key = (hikari.Snowflake(user), hikari.Snowflake(guild))
+
+        if member := cls._cache.get(key):
+            return member
+
+        record = await cls._db.fetchrow(FETCH_MEMBER_QUERY, *key)
 
         if not record:
-            member = cls(hikari.Snowflake(user), hikari.Snowflake(guild), strikes=0)
+            member = cls(*key, strikes=0)
             await member.update()
             return member
 
-        return cls(hikari.Snowflake(record["userid"]), hikari.Snowflake(record["guildid"]), strikes=record["strikes"])
+        member = cls(hikari.Snowflake(record["userid"]), hikari.Snowflake(record["guildid"]), strikes=record["strikes"])
+        cls._cache.set(key, member)
+        return member
 
 
 # Copyright (C) 2025 BBombs
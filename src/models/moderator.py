@@ -59,11 +59,12 @@ class Moderator:
             The reason for the timeout.
 
         """
-        expiration = duration.strftime("%X %x")
+        # Discord renders timestamp tokens in each user's own locale and timezone
         msg = f"""You have received a timeout for violating a moderation policy: **{reason}**
-Your timeout expires: {expiration} UTC."""
+Your timeout expires: <t:{int(duration.timestamp())}:F>."""
         await member.edit(
-            communication_disabled_until=duration, reason=f"Timed out for {reason} until {expiration} UTC."
+            communication_disabled_until=duration,
+            reason=f"Timed out for {reason} until {duration.isoformat(sep=' ', timespec='seconds')}.",
         )
         await self.notice(member, guild, msg)
 
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import abc
-import asyncio
-import time
 import typing as t
 from collections import deque
+from time import monotonic
 
 import attr
 import hikari
@@ -22,62 +21,39 @@ class RateLimiterContext(t.Protocol):
     def guild_id(self) -> hikari.Snowflake | None: ...
 
 
-class Request(object):
-    """Request object."""
-
-    def __getattr__(self, item):
-        return self
-
-    def __call__(self, *args, **kwargs):
-        return self
-
-
 @attr.define()
 class RateLimiter:
     """RateLimiter for a specific requesting entity, i.e. messages from a user."""
 
     bucket: RateLimiterBucket
-    reset_at: float
-    remaining_requests: int
-
-    request_queue: t.Deque[Request] = attr.field(factory=deque)
-    """List of requests to iterate through until remaining_requests is 0."""
-    queue_task: asyncio.Task[t.Any] | None = attr.field(default=None)
-    """The Async task that is currently handling the queue."""
-
-    @classmethod
-    def get_instance(cls, bucket: RateLimiterBucket) -> RateLimiter:
-        """Get a RateLimiter for a Bucket."""
-        return cls(
-            bucket=bucket,
-            reset_at=time.monotonic() + bucket.timespan,
-            remaining_requests=bucket.count + 1,
-        )
-
-    async def _run_queue(self) -> None:
-        """Iterate through and resolve request queue."""
-        if self.remaining_requests <= 0 and self.reset_at > time.monotonic():
-            await asyncio.sleep(self.reset_at - time.monotonic())
-            self.reset()
-
-        elif self.reset_at <= time.monotonic():
-            self.reset()
-
-        while self.remaining_requests > 0 and self.request_queue:
-            self.remaining_requests -= 1
-            self.request_queue.popleft()
-
-        self.queue_task = None
-
-    def start(self) -> None:
-        """Start the ratelimiter."""
-        if self.queue_task is None:
-            self.queue_task = asyncio.create_task(self._run_queue())
+
+    requests: t.Deque[float] = attr.field(
+        default=attr.Factory(lambda self: deque(maxlen=self.bucket.count + 1), takes_self=True)
+    )
+    """Times at which requests were made within the bucket's timespan, oldest first.
+    Only the latest requests needed to exceed the bucket's count are kept."""
+
+    def _expire(self, now: float) -> None:
+        """Drop requests older than the bucket's timespan."""
+        expired_at = now - self.bucket.timespan
+
+        while self.requests and self.requests[0] <= expired_at:
+            self.requests.popleft()
+
+    def add(self) -> None:
+        """Add a request to the ratelimiter."""
+        now = monotonic()
+        self._expire(now)
+        self.requests.append(now)
+
+    def is_rate_limited(self) -> bool:
+        """Will return True if more requests were made within the timespan than allowed."""
+        self._expire(monotonic())
+        return len(self.requests) > self.bucket.count
 
     def reset(self) -> None:
         """Reset the ratelimiter."""
-        self.reset_at = time.monotonic() + self.bucket.timespan
-        self.remaining_requests = self.bucket.count
+        self.requests.clear()
 
 
 class RateLimiterBucket(abc.ABC):
@@ -89,7 +65,7 @@ class RateLimiterBucket(abc.ABC):
         Parameters
         ----------
         timespan : float
-            The timespan in seconds after which the amount of requests resets.
+            The timespan in seconds over which requests are counted.
         count : int
             The number of requests allowed for a timespan before ratelimiting occurs.
 
@@ -97,25 +73,25 @@ class RateLimiterBucket(abc.ABC):
         self.timespan: float = timespan
         self.count: int = count
 
-        self._rate_limiters: t.Dict[str, RateLimiter] = {}
+        self._rate_limiters: t.Dict[t.Hashable, RateLimiter] = {}
         """Dictionary of keys representing a requesting entity and its ratelimiter."""
 
     @abc.abstractmethod
-    def _get_key(self, ctx: RateLimiterContext) -> str:
+    def _get_key(self, ctx: RateLimiterContext) -> t.Hashable:
         """Get key for RateLimiter."""
 
     def _get_ratelimiter(self, ctx: RateLimiterContext) -> RateLimiter:
         """Get the RateLimiter for this context or create one if there is not one."""
-        return self._rate_limiters.setdefault(self._get_key(ctx), RateLimiter.get_instance(self))
+        key = self._get_key(ctx)
 
-    def add(self, ctx: RateLimiterContext) -> None:
-        """Add a request to the queue for this context and start the ratelimiter."""
-        ratelimiter = self._get_ratelimiter(ctx)
-        request = Request()
+        if (rate_limiter := self._rate_limiters.get(key)) is None:
+            rate_limiter = self._rate_limiters[key] = RateLimiter(self)
 
-        ratelimiter.request_queue.append(request)
+        return rate_limiter
 
-        ratelimiter.start()
+    def add(self, ctx: RateLimiterContext) -> None:
+        """Add a request to the RateLimiter for this context."""
+        self._get_ratelimiter(ctx).add()
 
     def reset(self, ctx: RateLimiterContext) -> None:
         """Reset the RateLimiter for this context."""
@@ -126,13 +102,7 @@ class RateLimiterBucket(abc.ABC):
 
     def is_rate_limited(self, ctx: RateLimiterContext) -> bool:
         """Will return True if the provided context is being ratelimited."""
-        rate_limiter = self._get_ratelimiter(ctx)
-
-        if rate_limiter and rate_limiter.reset_at <= time.monotonic():
-            return False
-        elif rate_limiter and rate_limiter.remaining_requests <= 0:
-            return True
-        return False
+        return self._get_ratelimiter(ctx).is_rate_limited()
 
 
 class MessageRateLimiter(RateLimiterBucket):
@@ -144,7 +114,7 @@ class MessageRateLimiter(RateLimiterBucket):
         Parameters
         ----------
         timespan : float
-            The timespan in seconds after which the amount of requests resets.
+            The timespan in seconds over which requests are counted.
         count : int
             The number of requests allowed for a timespan before ratelimiting occurs.
         message_queue_size : int
@@ -154,22 +124,26 @@ class MessageRateLimiter(RateLimiterBucket):
         """
         self.message_queue_size: int = message_queue_size
 
-        self._message_queue: dict[str, t.Deque[hikari.Snowflake]] = {}
+        self._message_queue: dict[tuple[int, int], t.Deque[hikari.Snowflake]] = {}
         """Dict of keys representing members and a list of their last few messages."""
 
         super().__init__(timespan, count)
 
-    def _get_key(self, ctx: hikari.PartialMessage) -> str:
+    def _get_key(self, ctx: hikari.PartialMessage) -> tuple[int, int]:
         if not ctx.author or not ctx.guild_id:
             raise ValueError("context missing required parameters")
 
-        return str(ctx.guild_id) + "-" + str(ctx.author.id)
+        return (int(ctx.guild_id), int(ctx.author.id))
 
     def add_message(self, ctx: hikari.PartialMessage) -> None:
-        """Add a message to this context's queue and start the ratelimiter."""
+        """Add a message to this context's queue and ratelimiter."""
         self.add(ctx)
         if self.message_queue_size > 0:
-            queue = self._message_queue.setdefault(self._get_key(ctx), deque(maxlen=self.message_queue_size))
+            key = self._get_key(ctx)
+
+            if (queue := self._message_queue.get(key)) is None:
+                queue = self._message_queue[key] = deque(maxlen=self.message_queue_size)
+
             queue.append(ctx.id)
 
     def get_messages(self, ctx: hikari.PartialMessage) -> list[hikari.Snowflake] | None:
@@ -2,55 +2,57 @@ import asyncio
 import json
 import logging
 import typing as t
+from contextlib import suppress
 
 import aiohttp
+import attr
+
+from src.utils import TTLCache
 
 logger = logging.getLogger(__name__)
 
 LOOKUP_API_URL = "https://safebrowsing.googleapis.com/v4/threatMatches:find?key={key}"
 
 
+@attr.define
 class SafeBrowsingResult:
     """Safebrowsing api result object."""
 
-    def __init__(
-        self,
-        url: str,
-        status: str,
-        type: str | None = None,
-        cache_duration: float | None = None,
-    ) -> None:
-        """Safebrowsing api result object.
+    url: str
+    """The requested url."""
 
-        Parameters
-        ----------
-        url : str
-            The requested url.
-        status : str
-            Status of requested url, safe or unsafe.
-        type : str | None
-            Type threat the url poses, defaults to None.
-        cache_duration : float | None
-            The amount of time the url must be considered unsafe, defaults to None.
+    status: str
+    """Status of requested url, safe or unsafe."""
 
-        """
-        self.url: str = url
-        self.status: str = status
-        self.type: str | None = type
-        self.cache_duration: float | None = cache_duration
+    type: str | None = None
+    """Type threat the url poses, defaults to None."""
+
+    cache_duration: float | None = None
+    """The amount of time the url must be considered unsafe, defaults to None."""
 
 
 class SafeBrowsingCache:
     """Safebrowsing results cache."""
 
-    def __init__(self):
-        self._cache = {}
+    def __init__(self, maxsize: int = 100_000, ttl: float = 300) -> None:
+        """Safebrowsing results cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of results to store, defaults to 100,000.
+        ttl : float
+            The time in seconds a safe result is kept for, defaults to 300.
+            Unsafe results are kept for the cache duration given by the api.
+
+        """
+        self._cache: TTLCache[str, SafeBrowsingResult] = TTLCache(maxsize, ttl)
 
     def get(self, url: str) -> SafeBrowsingResult | None:
         return self._cache.get(url)
 
     def set(self, url: str, result: SafeBrowsingResult) -> None:
-        self._cache[url] = result
+        self._cache.set(url, result, result.cache_duration)
 
 
 # Missing ratelimiter for failed requests
@@ -74,11 +76,25 @@ class SafebrowsingClient:
         self.client_id = client_id
         self.client_version = client_version
 
-        self._session: aiohttp.ClientSession = aiohttp.ClientSession()
+        # Parts of the request body that are the same for every request
+        self._request_client: dict[str, str] = {"clientId": client_id, "clientVersion": client_version}
+        self._request_threat_info: dict[str, list[str]] = {
+            "threatTypes": ["MALWARE", "SOCIAL_ENGINEERING", "UNWANTED_SOFTWARE"],
+            "platformTypes": ["ANY_PLATFORM"],
+            "threatEntryTypes": ["URL"],
+        }
+
+        self._session: aiohttp.ClientSession = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
         self._cache: SafeBrowsingCache = SafeBrowsingCache()
         self._queue: asyncio.Queue = asyncio.Queue()
-        self._batch_size: int = 5
-        self._event = asyncio.Event()
+        # The lookup api accepts up to 500 threat entries per request
+        self._batch_size: int = 500
+        self._batch_window: float = 0.02
+        self._pending: dict[str, asyncio.Future[SafeBrowsingResult]] = {}
+        """Futures for queued urls, resolved with their result once looked up."""
 
         # Start a background task to process URLs in batches
         self._task: asyncio.Task[t.Any] = asyncio.create_task(self._run_queue())
@@ -97,16 +113,24 @@ class SafebrowsingClient:
             List of result objects for each requested url.
 
         """
+        lookups: list[SafeBrowsingResult | asyncio.Future[SafeBrowsingResult]] = []
+
         for url in urls:
-            if self._cache.get(url) is None:
+            if (result := self._cache.get(url)) is not None:
+                lookups.append(result)
+                continue
+
+            # Urls already queued by another check share the same future
+            if (future := self._pending.get(url)) is None:
+                future = self._pending[url] = asyncio.get_running_loop().create_future()
                 await self._queue.put(url)
 
-        # Make sure all urls have results
-        while any(self._cache.get(url) is None for url in urls):
-            # Wait for cache update
-            await self._event.wait()
+            lookups.append(future)
 
-        return [self._cache.get(url) for url in urls]  # type: ignore
+        # Shielded so a cancelled check does not cancel the lookup for other waiters
+        return [
+            lookup if isinstance(lookup, SafeBrowsingResult) else await asyncio.shield(lookup) for lookup in lookups
+        ]
 
     async def close(self) -> None:
         """Stop the queue task and close the aiohttp client session."""
@@ -117,48 +141,72 @@ class SafebrowsingClient:
         while True:
             urls = [await self._queue.get()]
 
-            # Get as many pending urls from queue as possible
-            while len(urls) < self._batch_size and not self._queue.empty():
-                urls.append(self._queue.get_nowait())
+            # Keep collecting urls until the batch is full or the window closes so bursts share one request
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self._batch_window
+
+            while len(urls) < self._batch_size:
+                if not self._queue.empty():
+                    urls.append(self._queue.get_nowait())
+                    continue
+
+                if (timeout := deadline - loop.time()) <= 0:
+                    break
+
+                try:
+                    urls.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
 
-            results = await self._lookup_urls(urls)
+            results: dict[str, SafeBrowsingResult] = {}
 
-            for result in results.values():
-                self._cache.set(result.url, result)
-                self._event.set()
-                self._event.clear()
+            # Futures are always resolved, otherwise later checks for these urls would wait on them forever
+            try:
+                results = await self._lookup_urls(urls)
+            finally:
+                for url in urls:
+                    if (result := results.get(url)) is not None:
+                        self._cache.set(url, result)
+                    else:
+                        # The lookup failed, treat the url as safe but leave it uncached so it is looked up again
+                        result = SafeBrowsingResult(url, "safe")
+
+                    if (future := self._pending.pop(url, None)) is not None and not future.done():
+                        future.set_result(result)
 
     async def _lookup_urls(self, urls: list[str]) -> dict[str, SafeBrowsingResult]:
-        response = await self._request_api(urls)
+        # Any failure is logged and the urls left without results, an exception here would end the queue task
+        try:
+            response = await self._request_api(urls)
 
-        results = {}
+            if response is None:
+                return {}
 
-        for url in urls:
-            for match in response["matches"]:
-                if url == match["threat"]["url"]:
+            # The api only returns matches for unsafe urls
+            matches = {match["threat"]["url"]: match for match in response.get("matches", [])}
+            results = {}
+
+            for url in urls:
+                if match := matches.get(url):
                     results[url] = SafeBrowsingResult(
-                        url,
-                        "unsafe",
-                        match["threatType"],
-                        float(match["cacheDuration"].strip("s")),
+                        url, "unsafe", match["threatType"], float(match["cacheDuration"][:-1])
                     )
+                else:
+                    results[url] = SafeBrowsingResult(url, "safe")
 
-            if not results[url]:
-                results[url] = SafeBrowsingResult(url, "safe")
+        except Exception:
+            logger.exception("Failed Safebrowsing Lookup request")
+            return {}
 
         return results
 
-    async def _request_api(self, urls: list[str]) -> dict[str, t.Any]:
-        threatEntries = [{"url": url} for url in urls]
+    async def _request_api(self, urls: list[str]) -> dict[str, t.Any] | None:
+        if not urls:
+            return {}
 
         request_body = {
-            "client": {"clientId": self.client_id, "clientVersion": self.client_version},
-            "threatInfo": {
-                "threatTypes": ["MALWARE", "SOCIAL_ENGINEERING", "UNWANTED_SOFTWARE"],
-                "platformTypes": ["ANY_PLATFORM"],
-                "threatEntryTypes": ["URL"],
-                "threatEntries": threatEntries,
-            },
+            "client": self._request_client,
+            "threatInfo": {**self._request_threat_info, "threatEntries": [{"url": url} for url in urls]},
         }
 
         async with self._session.request("POST", LOOKUP_API_URL.format(key=self.api_key), json=request_body) as resp:
@@ -167,11 +215,13 @@ class SafebrowsingClient:
                 return response
 
             else:
-                logger.error(
-                    f"""Failed Safebrowing Lookup request:
-{resp.status}
-{json.dumps(await resp.json(), indent=3)}"""
-                )
+                body = await resp.text()
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    with suppress(ValueError):
+                        body = json.dumps(json.loads(body), indent=3)
+
+                logger.error("Failed Safebrowsing Lookup request:\n%s\n%s", resp.status, body)
 
 
 # Copyright (C) 2025 BBombs
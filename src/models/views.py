@@ -4,7 +4,22 @@ import hikari
 import lightbulb
 import miru
 
-from src.static import *
+from src.static import FAIL_EMBED_COLOUR, FAIL_EMOJI
+
+_NOT_AUTHOR_EMBED = hikari.Embed(
+    title=None,
+    description=f"{FAIL_EMOJI} You cannot interact with this menu.",
+    colour=FAIL_EMBED_COLOUR,
+)
+
+
+async def _check_author(lightbulb_ctx: lightbulb.Context | None, ctx: miru.ViewContext) -> bool:
+    """Will return true if the interaction is from the menu's author or no author is set."""
+    if lightbulb_ctx and ctx.user.id != lightbulb_ctx.author.id:
+        await ctx.respond(embed=_NOT_AUTHOR_EMBED, flags=hikari.MessageFlag.EPHEMERAL)
+        return False
+
+    return True
 
 
 class AuthorOnlyView(miru.View):
@@ -34,18 +49,7 @@ class AuthorOnlyView(miru.View):
         self.lightbulb_ctx = lightbulb_ctx
 
     async def view_check(self, ctx: miru.ViewContext) -> bool:
-        if self.lightbulb_ctx and ctx.user.id != self.lightbulb_ctx.author.id:
-            await ctx.respond(
-                embed=hikari.Embed(
-                    title=None,
-                    description=f"{FAIL_EMOJI} You cannot interact with this menu.",
-                    colour=FAIL_EMBED_COLOUR,
-                ),
-                flags=hikari.MessageFlag.EPHEMERAL,
-            )
-            return False
-
-        return True
+        return await _check_author(self.lightbulb_ctx, ctx)
 
 
 class NavView(miru.View):
@@ -77,6 +81,14 @@ class NavView(miru.View):
         self.pages = pages
         self._current_page = 0
 
+        self._payloads: list[dict[str, t.Any]] = [self.prepare_page(page) for page in pages]
+        """Prepared payloads for each page, pages are static so these are only built once."""
+
+        self._first_button: miru.abc.ViewItem = self.get_item_by_id("first")
+        self._prev_button: miru.abc.ViewItem = self.get_item_by_id("prev")
+        self._next_button: miru.abc.ViewItem = self.get_item_by_id("next")
+        self._last_button: miru.abc.ViewItem = self.get_item_by_id("last")
+
     @property
     def current_page(self) -> int:
         """Current page index the navigator is on."""
@@ -106,22 +118,13 @@ class NavView(miru.View):
         """Send a new page, replacing the old one."""
         self._current_page = page_index
 
-        for item in self.children:
-            item.disabled = False
-
-        if self.current_page == 0:
-            self.get_item_by_id("prev").disabled = True
-            self.get_item_by_id("first").disabled = True
-
-        if self.current_page == len(self.pages) - 1:
-            self.get_item_by_id("next").disabled = True
-            self.get_item_by_id("last").disabled = True
+        at_start = page_index == 0
+        at_end = page_index == len(self.pages) - 1
 
-        page = self.pages[self.current_page]
+        self._first_button.disabled = self._prev_button.disabled = at_start
+        self._next_button.disabled = self._last_button.disabled = at_end
 
-        payload = self.prepare_page(page)
-
-        await ctx.edit_response(**payload)
+        await ctx.edit_response(**self._payloads[page_index])
 
     @miru.button(emoji="⏮️", custom_id="first", style=hikari.ButtonStyle.SECONDARY)
     async def first_button(self, ctx: miru.ViewContext, button: miru.Button) -> None:
@@ -148,11 +151,7 @@ class NavView(miru.View):
         for item in self.children:
             item.disabled = True
 
-        page = self.pages[self.current_page]
-
-        payload = self.prepare_page(page)
-
-        await self.message.edit(**payload)
+        await self.message.edit(**self._payloads[self.current_page])
 
         self.stop()
 
@@ -186,18 +185,7 @@ class AuthorOnlyNavView(NavView):
         self.lightbulb_ctx = lightbulb_ctx
 
     async def view_check(self, ctx: miru.ViewContext) -> bool:
-        if ctx.user.id != self.lightbulb_ctx.author.id:
-            await ctx.respond(
-                embed=hikari.Embed(
-                    title=None,
-                    description=f"{FAIL_EMOJI} You cannot interact with this menu.",
-                    colour=FAIL_EMBED_COLOUR,
-                ),
-                flags=hikari.MessageFlag.EPHEMERAL,
-            )
-            return False
-
-        return True
+        return await _check_author(self.lightbulb_ctx, ctx)
 
 
 class ConfirmationView(AuthorOnlyView):
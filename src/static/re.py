@@ -1,18 +1,35 @@
 __all__ = [
     "FAKE_URL_REGEX",
+    "FAKE_URL_SEARCH",
     "FORMATTING_REGEX",
     "HYPERLINK_REGEX",
     "INVITE_REGEX",
+    "INVITE_SEARCH",
+    "SQL_CODEBLOCK_REGEX",
+    "URL_FINDALL",
+    "URL_FULLMATCH",
     "URL_REGEX",
 ]
 
 import re
 
-URL_REGEX = re.compile(r"(http|https:\/\/)([\w_-]+(?:(?:\.[\w_-]+)+))([\w.,@?^=%&:\/~+#-]*[\w@?^=%&\/~+#-])")
-INVITE_REGEX = re.compile(r"(https?:\/\/)?(www.)?(discord.(gg|io|me|li)|discordapp.com\/invite)\/[^\s\/]+?(?=\b)")
-HYPERLINK_REGEX = re.compile(r"\[\S.*?\]\((https|http):\/\/\S.*?\)")
-FAKE_URL_REGEX = re.compile(r"\[\S*?\.\S{2,63}\]\((https|http):\/\/\S.*?\)")
-FORMATTING_REGEX = re.compile(r"<[:|id|t|@|a:|#]\S+>")
+URL_REGEX = re.compile(
+    r"(?P<scheme>https?:\/\/)(?P<domain>[\w-]++(?:\.[\w-]++)++)(?P<path>(?:[.,:]*+[\w@?^=%&\/~+#-])*+)", re.IGNORECASE
+)
+INVITE_REGEX = re.compile(
+    r"(https?:\/\/)?(www.)?(discord.(gg|io|me|li)|discordapp.com\/invite)\/[^\s\/]+?(?=\b)", re.ASCII
+)
+HYPERLINK_REGEX = re.compile(r"\[\S.*?\]\((https|http):\/\/\S[^)\n]*+\)")
+# Link text stops at the next "[" so each opening bracket is only scanned up to the following one
+FAKE_URL_REGEX = re.compile(r"\[[^\s\[]*?\.\S{2,63}\]\((https|http):\/\/\S[^)\n]*+\)")
+FORMATTING_REGEX = re.compile(r"<[:idta@#|]\S+>", re.ASCII)
+SQL_CODEBLOCK_REGEX = re.compile(r"```sql|`+")
+
+# Bound methods for the patterns run on every message
+URL_FINDALL = URL_REGEX.findall
+URL_FULLMATCH = URL_REGEX.fullmatch
+INVITE_SEARCH = INVITE_REGEX.search
+FAKE_URL_SEARCH = FAKE_URL_REGEX.search
 
 
 # Copyright (C) 2025 BBombs
@@ -1,3 +1,4 @@
+from .cache import *
 from .helpers import *
 
 
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+import typing as t
+from collections import OrderedDict
+
+__all__ = ["TTLCache"]
+
+KT = t.TypeVar("KT")
+VT = t.TypeVar("VT")
+
+
+class TTLCache(t.Generic[KT, VT]):
+    """Size bounded least recently used cache where entries expire after a set time."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Size bounded least recently used cache where entries expire after a set time.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of entries to store, the least recently used entry is evicted first.
+        ttl : float
+            The time in seconds an entry is kept for.
+
+        """
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+
+        self._data: OrderedDict[KT, tuple[float, VT]] = OrderedDict()
+        """Ordered dict of keys and their expiry time and value, least recently used first."""
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: KT) -> VT | None:
+        """Get the value for a key, returns None if missing or expired."""
+        try:
+            expires_at, value = self._data[key]
+        except KeyError:
+            return None
+
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: KT, value: VT, ttl: float | None = None) -> None:
+        """Set the value for a key, evicting the least recently used entry if full.
+
+        Parameters
+        ----------
+        key : KT
+            The key to set.
+        value : VT
+            The value to store.
+        ttl : float | None
+            The time in seconds this entry is kept for, defaults to the cache's ttl.
+
+        """
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+
+# Copyright (C) 2025 BBombs
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import typing as t
 
-import aiofiles
 import hikari
 import hikari.guilds
 import lightbulb
@@ -12,8 +13,22 @@ if t.TYPE_CHECKING:
 
 from src.static.re import *
 
+_domain_lists: dict[str, tuple[float, frozenset[str]]] = {}
+"""Dict of list file paths and their modified time and set of domains."""
 
-def has_permissions(member: hikari.Member, perms: hikari.Permissions, strict: bool = True) -> bool:
+_MOD_BYPASS_PERMS: t.Final[hikari.Permissions] = hikari.Permissions.ADMINISTRATOR | hikari.Permissions.MANAGE_GUILD
+"""Permissions that exempt a member from moderation by the bot."""
+
+_bot_top_positions: dict[hikari.Snowflake, int] = {}
+"""Dict of guild ids and the position of the bot's highest role in that guild."""
+
+
+def has_permissions(
+    member: hikari.Member,
+    perms: hikari.Permissions,
+    strict: bool = True,
+    member_perms: hikari.Permissions | None = None,
+) -> bool:
     """Will return true if a member has specified permissions.
 
     Parameters
@@ -25,25 +40,31 @@ def has_permissions(member: hikari.Member, perms: hikari.Permissions, strict: bo
     strict : bool
         Whether the member must poses all or at least one of the permissions.
         Defaults to True.
+    member_perms : hikari.Permissions | None
+        The member's permissions if already resolved, defaults to None meaning they are resolved from the cache.
 
     """
-    member_perms: hikari.Permissions = lightbulb.utils.permissions_for(member)
+    if member_perms is None:
+        member_perms = lightbulb.utils.permissions_for(member)
 
     if member_perms == hikari.Permissions.NONE:
         return False
 
-    if strict and (member_perms & perms) == perms:
-        return True
+    if strict:
+        return (member_perms & perms) == perms
 
-    elif not strict:
-        for perm in perms:
-            if perm in member_perms:
-                return True
+    return (member_perms & perms) != hikari.Permissions.NONE
 
-    return False
+
+def _top_pos(member: hikari.Member, guild: hikari.Guild) -> int:
+    """Get the position of a member's highest role, -1 if none of their roles are cached."""
+    return max(
+        (role.position for role_id in member.role_ids if (role := guild.get_role(role_id)) is not None),
+        default=-1,
+    )
 
 
-def higher_role(member: hikari.Member, bot: hikari.Member) -> bool:
+def higher_role(member: hikari.Member, bot: hikari.Member, guild: hikari.Guild | None = None) -> bool:
     """Will return true if the members highest role is higher than the bots.
 
     Parameters
@@ -52,17 +73,38 @@ def higher_role(member: hikari.Member, bot: hikari.Member) -> bool:
         The member to check.
     bot : hikari.Member
         The bot member for the relevant server.
+    guild : hikari.Guild | None
+        The relevant server if the caller already has it, defaults to None meaning it is fetched from the cache.
 
     """
-    member_role = member.get_top_role()
-    bot_role = bot.get_top_role()
-    assert member_role is not None
-    assert bot_role is not None
+    if guild is None:
+        guild = member.get_guild()
+
+    assert guild is not None
+
+    # The bot's roles rarely change so its top role is cached until a role or the bot member is updated
+    if (bot_pos := _bot_top_positions.get(guild.id)) is None:
+        bot_pos = _top_pos(bot, guild)
+
+        if bot_pos >= 0:
+            _bot_top_positions[guild.id] = bot_pos
+
+    return _top_pos(member, guild) > bot_pos
 
-    return member_role.position > bot_role.position
 
+def clear_bot_top_role(guild_id: hikari.Snowflakeish) -> None:
+    """Remove the bot's cached highest role for a guild, to be called when its roles may have changed.
 
-def can_mod(member: hikari.Member, bot: hikari.Member) -> bool:
+    Parameters
+    ----------
+    guild_id : hikari.Snowflakeish
+        The guild to clear the cached role for.
+
+    """
+    _bot_top_positions.pop(hikari.Snowflake(guild_id), None)
+
+
+def can_mod(member: hikari.Member, bot: hikari.Member, guild: hikari.Guild | None = None) -> bool:
     """Will return true if the bot can moderate the member.
 
     Parameters
@@ -71,9 +113,12 @@ def can_mod(member: hikari.Member, bot: hikari.Member) -> bool:
         The member to check.
     bot : hikari.Member
         The bot member for the relevant server.
+    guild : hikari.Guild | None
+        The relevant server if the caller already has it, defaults to None meaning it is fetched from the cache.
 
     """
-    guild = member.get_guild()
+    if guild is None:
+        guild = member.get_guild()
 
     if guild is None:
         return False
@@ -81,12 +126,63 @@ def can_mod(member: hikari.Member, bot: hikari.Member) -> bool:
     if guild.owner_id == member.id:
         return False
 
-    if higher_role(member, bot):
+    # Permissions are a single bitwise test so are checked before comparing both members' roles
+    member_perms: hikari.Permissions = lightbulb.utils.permissions_for(member)
+
+    if has_permissions(member, _MOD_BYPASS_PERMS, strict=False, member_perms=member_perms):
         return False
 
-    perms: hikari.Permissions = hikari.Permissions.ADMINISTRATOR | hikari.Permissions.MANAGE_GUILD
+    return not higher_role(member, bot, guild)
+
+
+def extract_domain(url: str) -> str | None:
+    """Will return the domain of the provided url or None if it is not a valid url.
+
+    Parameters
+    ----------
+    url : str
+        The url to get the domain from.
+
+    """
+    # Cheap checks to skip the regex for anything that can't be a url, the shortest being http://a.b
+    if len(url) < 10 or "://" not in url:
+        return None
+
+    if match := URL_FULLMATCH(url):
+        return match.group("domain").lower()
+
+    return None
+
+
+def _read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+async def get_domain_list(path: str) -> frozenset[str]:
+    """Get the set of domains in a list file, the file is only read again once modified.
+
+    Parameters
+    ----------
+    path : str
+        Path to the list file.
+
+    """
+    mtime = os.stat(path).st_mtime
+    cached = _domain_lists.get(path)
+
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    # One thread dispatch for the whole read rather than one per aiofiles call
+    text = await asyncio.to_thread(_read_text, path)
+    lines = map(str.strip, text.lower().splitlines())
+
+    # Skip blank lines and // comments
+    domains = frozenset(line for line in lines if line and not line.startswith("//"))
 
-    return not has_permissions(member, perms, strict=False)
+    _domain_lists[path] = (mtime, domains)
+    return domains
 
 
 async def domain_in_list(url: str, path: str) -> bool:
@@ -101,16 +197,8 @@ async def domain_in_list(url: str, path: str) -> bool:
         Path to the list file.
 
     """
-    if match := URL_REGEX.fullmatch(url.lower()):
-        if match.group(3)[0] != "/":
-            domain = match.group(2) + match.group(3)
-        else:
-            domain = match.group(2)
-
-        async with aiofiles.open(path, "r", encoding="utf-8") as list:
-            async for url in list:
-                if url.strip() == domain:
-                    return True
+    if domain := extract_domain(url):
+        return domain in await get_domain_list(path)
 
     return False
 